@@ -322,28 +322,29 @@ def _json_to_datetime(value, date_only=False):
     raise exception
 
 
+def _convert_bool(value, key):
+    if isinstance(value, types.NoneType):
+        return False
+    elif isinstance(value, bool):
+        return value
+    elif isinstance(value, basestring):
+        value = value.lower()
+        if value == 'true':
+            return True
+        elif value == 'false':
+            return False
+    raise ValueError('Bad boolean value for %s: %s' % (key, value))
+
+
 def json_to_dict(source_dict, schema, permit_none_values=False):
     """Converts JSON dictionary into Python dictionary using schema."""
 
-    def convert_bool(value, key):
-        if isinstance(value, types.NoneType):
-            return False
-        elif isinstance(value, bool):
-            return value
-        elif isinstance(value, basestring):
-            value = value.lower()
-            if value == 'true':
-                return True
-            elif value == 'false':
-                return False
-        raise ValueError('Bad boolean value for %s: %s' % (key, value))
-
     output = {}
     for key, attr in schema['properties'].items():
         # Skip schema elements that don't exist in source.
 
         if key not in source_dict:
-            is_optional = convert_bool(attr.get('optional'), 'optional')
+            is_optional = _convert_bool(attr.get('optional'), 'optional')
             if not is_optional:
                 raise ValueError('Missing required attribute: %s' % key)
             continue
@@ -368,7 +369,7 @@ def json_to_dict(source_dict, schema, permit_none_values=False):
         elif attr_type in ('integer', 'timestamp'):
             output[key] = int(source_dict[key]) if source_dict[key] else 0
         elif attr_type == 'boolean':
-            output[key] = convert_bool(source_dict[key], key)
+            output[key] = _convert_bool(source_dict[key], key)
         elif attr_type == 'array':
             subschema = attr['items']
             array = []
@@ -380,6 +381,84 @@ def json_to_dict(source_dict, schema, permit_none_values=False):
     return output
 
 
+def _compile_object_converter(schema):
+    if 'properties' not in schema:
+        # Not a struct; leave json_to_dict() to fail on use, as it would.
+        return lambda value: json_to_dict(value, schema)
+    return compile_json_to_dict(schema)
+
+
+def _deferred_lookup(attr, name):
+    # json_to_dict() only reads some schema entries when it converts a
+    # present, non-None value; fail at that point, too, not when compiling.
+    def lookup_on_use(unused_value):
+        return attr[name]
+    return lookup_on_use
+
+
+def _compile_value_converter(key, attr):
+    if 'type' not in attr:
+        return _deferred_lookup(attr, 'type')
+    attr_type = attr['type']
+    if attr_type not in JSON_TYPES:
+        def reject(unused_value):
+            raise ValueError('Unsupported JSON type: %s' % attr_type)
+        return reject
+    if attr_type == 'object':
+        return _compile_object_converter(attr)
+    elif attr_type == 'datetime' or attr_type == 'date':
+        date_only = attr_type == 'date'
+        return lambda value: _json_to_datetime(value, date_only)
+    elif attr_type == 'number':
+        return float
+    elif attr_type in ('integer', 'timestamp'):
+        return lambda value: int(value) if value else 0
+    elif attr_type == 'boolean':
+        return lambda value: _convert_bool(value, key)
+    elif attr_type == 'array':
+        if 'items' not in attr:
+            return _deferred_lookup(attr, 'items')
+        convert_item = _compile_object_converter(attr['items'])
+        return lambda value: [convert_item(item) for item in value]
+    else:
+        return lambda value: value
+
+
+def compile_json_to_dict(schema, permit_none_values=False):
+    """Builds a function equivalent to json_to_dict() for a fixed schema.
+
+    The schema is walked once, here, rather than on every conversion; the
+    returned function just applies a prepared converter to each property.
+    Use this when many dicts are converted against the same schema.
+
+    Args:
+        schema: dict. A JSON schema dict, as for json_to_dict().  It must not
+            be modified while the returned function is in use.
+        permit_none_values: bool. As for json_to_dict().
+    Returns:
+        A function taking a JSON source dict and returning the Python dict.
+    """
+    converters = [
+        (key, attr, _compile_value_converter(key, attr))
+        for key, attr in schema['properties'].items()]
+
+    def convert(source_dict):
+        output = {}
+        for key, attr, converter in converters:
+            if key not in source_dict:
+                is_optional = _convert_bool(attr.get('optional'), 'optional')
+                if not is_optional:
+                    raise ValueError('Missing required attribute: %s' % key)
+                continue
+            value = source_dict[key]
+            if permit_none_values and value is None:
+                output[key] = None
+                continue
+            output[key] = converter(value)
+        return output
+    return convert
+
+
 def string_to_value(string, value_type):
     """Converts string representation to a value."""
     if value_type == str:
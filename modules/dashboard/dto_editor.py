@@ -19,8 +19,6 @@ __author__ = [
     'Mike Gainer (mgainer@googe.com)'
 ]
 
-import cgi
-import copy
 import urllib
 
 from common import utils as common_utils
@@ -30,6 +28,11 @@ from models import roles
 from models import transforms
 from modules.oeditor import oeditor
 
+# (JSON schema dict, compiled json_to_dict converter) pairs built by
+# BaseDatastoreRestHandler, keyed by handler class and the schema load hooks
+# in effect at build time.
+_JSON_SCHEMA_DICT_CACHE = {}
+
 
 class BaseDatastoreAssetEditor(utils.ApplicationHandler):
 
@@ -41,13 +44,10 @@ class BaseDatastoreAssetEditor(utils.ApplicationHandler):
         if exit_url:
             exit_url = self.canonicalize_url(exit_url)
         if key and deletable:
-            delete_url = '%s?%s' % (
-                self.canonicalize_url(rest_handler.URI),
-                urllib.urlencode({
-                    'key': key,
-                    'xsrf_token': cgi.escape(
-                        self.create_xsrf_token(rest_handler.XSRF_TOKEN))
-                    }))
+            delete_url = '%s?%s' % (rest_url, urllib.urlencode((
+                ('key', key),
+                ('xsrf_token', XsrfTokenManager.create_xsrf_token_cached(
+                    rest_handler.XSRF_TOKEN)))))
         else:
             delete_url = None
 
@@ -111,6 +111,38 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
     # from the dict which was the payload of a PUT request.
     PRE_SAVE_HOOKS = ()
 
+    # Whether the JSON schema dict from get_schema() may be built once and
+    # reused across requests.  It holds only field names and types, not the
+    # editor annotations, so it is stable unless the set of fields itself
+    # depends on mutable state; such handlers should set this to False.
+    CACHE_JSON_SCHEMA_DICT = True
+
+    @classmethod
+    def _get_json_schema(cls):
+        if not cls.CACHE_JSON_SCHEMA_DICT:
+            json_schema_dict = cls.get_schema().get_json_schema_dict()
+            return (
+                json_schema_dict,
+                transforms.compile_json_to_dict(json_schema_dict))
+        cache_key = (cls, tuple(cls.SCHEMA_LOAD_HOOKS))
+        json_schema = _JSON_SCHEMA_DICT_CACHE.get(cache_key)
+        if json_schema is None:
+            json_schema_dict = cls.get_schema().get_json_schema_dict()
+            json_schema = (
+                json_schema_dict,
+                transforms.compile_json_to_dict(json_schema_dict))
+            _JSON_SCHEMA_DICT_CACHE[cache_key] = json_schema
+        return json_schema
+
+    @classmethod
+    def get_json_schema_dict(cls):
+        """Get the JSON schema dict used to convert PUT payloads."""
+        return cls._get_json_schema()[0]
+
+    @classmethod
+    def get_json_to_dict(cls):
+        """Get a function applying json_to_dict() with the PUT schema."""
+        return cls._get_json_schema()[1]
 
     def sanitize_input_dict(self, json_dict):
         """Give subclasses a hook to clean up incoming data before storage.
@@ -144,6 +176,22 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
         """
         pass
 
+    def validate_batch_item(self, item_dict, key, accepted, errors):
+        """Allow subclasses to check an item against earlier batch items.
+
+        validate() can only compare an item with what is already stored,
+        and nothing in a batch is stored until every item has passed.
+        Subclasses enforcing uniqueness should repeat those checks here.
+
+        Args:
+          item_dict: The item's Python dict, as passed to validate().
+          key: The key for the item, if available.
+          accepted: A list of (key, item_dict) pairs for the items earlier
+              in the same batch, all of which have passed validation.
+          errors: A list of strings, as for validate().
+        """
+        pass
+
     def pre_save_hook(self, dto):
         """Give subclasses a hook to modify the DTO before saving."""
         pass
@@ -181,7 +229,18 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
         raise NotImplementedError('Subclasses must override this function.')
 
     def put(self):
-        """Store a DTO in the datastore in response to a PUT."""
+        """Store one or more DTOs in the datastore in response to a PUT.
+
+        The request normally carries a single item as 'key' and 'payload'.
+        Clients saving several items at once may instead send 'payloads',
+        a list of {'key': ..., 'payload': ...} dicts; these are validated
+        together and written with a single batch put.
+        """
+        # Reject non-admins before spending any time parsing the request.
+        if not roles.Roles.is_course_admin(self.app_context):
+            transforms.send_json_response(self, 401, 'Access denied.')
+            return
+
         request = transforms.loads(self.request.get('request'))
         key = request.get('key')
 
@@ -189,44 +248,89 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
                 request, self.XSRF_TOKEN, {'key': key}):
             return
 
-        if not roles.Roles.is_course_admin(self.app_context):
-            transforms.send_json_response(
-                self, 401, 'Access denied.', {'key': key})
+        is_batch = 'payloads' in request
+        if is_batch:
+            payloads = request['payloads']
+        else:
+            payloads = [{'key': key, 'payload': request.get('payload')}]
+        if not isinstance(payloads, list) or not all(
+                isinstance(entry, dict) and
+                isinstance(entry.get('payload'), (basestring, dict))
+                for entry in payloads):
+            transforms.send_json_response(self, 400, 'Malformed request.')
             return
 
-        payload = request.get('payload')
-        json_dict = transforms.loads(payload)
-        self.sanitize_input_dict(json_dict)
-
-        errors = []
-        try:
-            python_dict = transforms.json_to_dict(
-                json_dict, self.get_schema().get_json_schema_dict())
-
-            version = python_dict.get('version')
-            if version not in self.SCHEMA_VERSIONS:
-                errors.append('Version %s not supported.' % version)
-            else:
-                python_dict = self.transform_after_editor_hook(python_dict)
-                self.validate(python_dict, key, version, errors)
-        except (TypeError, ValueError) as err:
-            errors.append(str(err))
-        if errors:
-            self.validation_error('\n'.join(errors), key=key)
+        keys_after_save = self.put_batch(payloads)
+        if keys_after_save is None:
             return
-
-        if key:
-            item = self.DAO.DTO(key, python_dict)
+        if is_batch:
+            payload_dict = {'keys': keys_after_save}
         else:
-            item = self.DAO.DTO(None, python_dict)
+            payload_dict = {'key': keys_after_save[0]}
+        transforms.send_json_response(
+            self, 200, 'Saved.', payload_dict=payload_dict)
 
-        self.pre_save_hook(item)
-        common_utils.run_hooks(self.PRE_SAVE_HOOKS, item, python_dict)
-        key_after_save = self.DAO.save(item)
-        self.after_save_hook()
+    def put_batch(self, payloads):
+        """Validate a list of editor payloads and save them in one batch.
 
-        transforms.send_json_response(
-            self, 200, 'Saved.', payload_dict={'key': key_after_save})
+        Callers are responsible for the XSRF and access checks, and for
+        checking that payloads has the shape described below.
+
+        Args:
+          payloads: A list of dicts, each having a 'key' (None for new items)
+              and a 'payload' holding the editor form contents, either
+              as a JSON-encoded string or as an already-decoded object.
+        Returns:
+          A list of the keys of the saved items, in the order given.  If
+          any item fails validation, nothing is saved, a validation error
+          response has already been sent, and None is returned.
+        """
+        json_to_dict = self.get_json_to_dict()
+        items = []
+        accepted = []
+        keys_seen = set()
+        # Shared by all items: any error ends the batch, so it starts empty.
+        errors = []
+        for entry in payloads:
+            key = entry.get('key')
+            if key:
+                if str(key) in keys_seen:
+                    self.validation_error(
+                        'Item %s appears more than once.' % key, key=key)
+                    return None
+                keys_seen.add(str(key))
+            json_dict = entry.get('payload')
+            if not isinstance(json_dict, dict):
+                json_dict = transforms.loads(json_dict)
+            self.sanitize_input_dict(json_dict)
+
+            try:
+                python_dict = json_to_dict(json_dict)
+
+                version = python_dict.get('version')
+                if version not in self.SCHEMA_VERSIONS:
+                    errors.append('Version %s not supported.' % version)
+                else:
+                    python_dict = self.transform_after_editor_hook(python_dict)
+                    self.validate(python_dict, key, version, errors)
+                    if not errors:
+                        self.validate_batch_item(
+                            python_dict, key, accepted, errors)
+            except (TypeError, ValueError) as err:
+                errors.append(str(err))
+            if errors:
+                self.validation_error('\n'.join(errors), key=key)
+                return None
+
+            accepted.append((key, python_dict))
+            items.append((self.DAO.DTO(key or None, python_dict), python_dict))
+
+        for item, python_dict in items:
+            self.pre_save_hook(item)
+            common_utils.run_hooks(self.PRE_SAVE_HOOKS, item, python_dict)
+        keys_after_save = self.DAO.save_all([item for item, _ in items])
+        self.after_save_hook()
+        return keys_after_save
 
     def delete(self):
         """Delete the Entity in response to REST request."""
@@ -267,8 +371,7 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
                     self, 403, 'Version %s not supported.' % version,
                     {'key': key})
                 return
-            display_dict = copy.copy(item.dict)
-            display_dict['id'] = item.id
+            display_dict = dict(item.dict, id=item.id)
             common_utils.run_hooks(self.PRE_LOAD_HOOKS, item, display_dict)
             payload_dict = self.transform_for_editor_hook(display_dict)
         else:
@@ -277,4 +380,5 @@ class BaseDatastoreRestHandler(utils.BaseRESTHandler):
         transforms.send_json_response(
             self, 200, 'Success',
             payload_dict=payload_dict,
-            xsrf_token=XsrfTokenManager.create_xsrf_token(self.XSRF_TOKEN))
+            xsrf_token=XsrfTokenManager.create_xsrf_token_cached(
+                self.XSRF_TOKEN))
@@ -122,6 +122,11 @@ class LabelRestHandler(dto_editor.BaseDatastoreRestHandler):
                 (not key or label.id != long(key))):
                 errors.append('There is already a label with this title!')
 
+    def validate_batch_item(self, label_dict, unused_key, accepted, errors):
+        if label_dict['title'] in {
+                item_dict['title'] for _, item_dict in accepted}:
+            errors.append('There is already a label with this title!')
+
     def is_deletion_allowed(self, label):
         # TODO(mgainer): When labels on course units get modified to be
         # IDs of labels rather than strings, enforce non-deletion of
@@ -115,6 +115,12 @@ class BaseQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
             errors.append(
                 'The description must be different from existing questions.')
 
+    def validate_batch_item(self, question_dict, unused_key, accepted, errors):
+        if question_dict['description'] in {
+                item_dict['description'] for _, item_dict in accepted}:
+            errors.append(
+                'The description must be different from existing questions.')
+
 
 class McQuestionRESTHandler(BaseQuestionRESTHandler):
     """REST handler for editing multiple choice questions."""
@@ -361,23 +367,23 @@ class GiftQuestionRESTHandler(dto_editor.BaseDatastoreRestHandler):
 
     def put(self):
         """Store a QuestionGroupDTO and QuestionDTO in the datastore."""
+        if not roles.Roles.is_course_admin(self.app_context):
+            transforms.send_json_response(self, 401, 'Access denied.')
+            return
+
         request = transforms.loads(self.request.get('request'))
 
         if not self.assert_xsrf_token_or_fail(
                 request, self.XSRF_TOKEN, {'key': None}):
             return
 
-        if not roles.Roles.is_course_admin(self.app_context):
-            transforms.send_json_response(self, 401, 'Access denied.')
-            return
-
-        payload = request.get('payload')
-        json_dict = transforms.loads(payload)
+        json_dict = request.get('payload')
+        if not isinstance(json_dict, dict):
+            json_dict = transforms.loads(json_dict)
 
         errors = []
         try:
-            python_dict = transforms.json_to_dict(
-                json_dict, self.get_schema().get_json_schema_dict())
+            python_dict = self.get_json_to_dict()(json_dict)
             questions = gift.GiftParser.parse_questions(
                 python_dict['questions'])
             self.validate_question_descriptions(questions, errors)
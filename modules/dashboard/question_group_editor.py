@@ -146,3 +146,10 @@ class QuestionGroupRESTHandler(dto_editor.BaseDatastoreRestHandler):
             except ValueError:
                 errors.append(
                     'Item %s must have a numeric weight.' % (index + 1))
+
+    def validate_batch_item(
+            self, question_group_dict, unused_key, accepted, errors):
+        if question_group_dict['description'] in {
+                item_dict['description'] for _, item_dict in accepted}:
+            errors.append('The description must be different '
+                          'from existing question groups.')
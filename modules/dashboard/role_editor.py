@@ -58,6 +58,9 @@ class RoleRESTHandler(dto_editor.BaseDatastoreRestHandler):
 
     SCHEMA_VERSIONS = ['1.5']
 
+    # The schema has one sub-registry per module with registered permissions.
+    CACHE_JSON_SCHEMA_DICT = False
+
     DAO = RoleDAO
 
     INACTIVE_MODULES = 'Inactive Modules'
@@ -149,6 +152,11 @@ class RoleRESTHandler(dto_editor.BaseDatastoreRestHandler):
         if not role_dict['name'] or role_dict['name'] in role_names:
             errors.append('The role must have a unique non-empty name.')
 
+    def validate_batch_item(self, role_dict, unused_key, accepted, errors):
+        if role_dict['name'] in {
+                item_dict['name'] for _, item_dict in accepted}:
+            errors.append('The role must have a unique non-empty name.')
+
     def transform_after_editor_hook(self, role_dict):
         """Edit the dict generated by the role editor."""
         role_dict['name'] = role_dict['name'].strip()
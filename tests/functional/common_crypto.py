@@ -121,6 +121,21 @@ class XsrfTokenManagerTests(actions.TestBase):
         self.assertFalse(crypto.XsrfTokenManager.is_xsrf_token_valid(
             t, action + '.'))
 
+    def test_cached_token(self):
+        # Make the reuse window wide enough that both calls always land in
+        # the same bucket, regardless of the wall clock.
+        self.swap(crypto.XsrfTokenManager, 'CACHED_TOKEN_REUSE_SECS', 10 ** 9)
+        self.swap(crypto.XsrfTokenManager, '_cached_tokens', (None, {}))
+        action = 'lob_cheese'
+        t1 = crypto.XsrfTokenManager.create_xsrf_token_cached(action)
+        t2 = crypto.XsrfTokenManager.create_xsrf_token_cached(action)
+        self.assertEquals(t1, t2)
+        self.assertTrue(crypto.XsrfTokenManager.is_xsrf_token_valid(
+            t1, action))
+        t3 = crypto.XsrfTokenManager.create_xsrf_token_cached('eat_cheese')
+        self.assertFalse(crypto.XsrfTokenManager.is_xsrf_token_valid(
+            t3, action))
+
 
 class PiiObfuscationHmac(actions.TestBase):
 
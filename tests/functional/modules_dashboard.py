@@ -33,7 +33,10 @@ from models.roles import Permission
 from models.roles import Roles
 from modules.dashboard import dashboard
 from common import menus
+from common import schema_fields
 from modules.dashboard.dashboard import DashboardHandler
+from modules.dashboard.question_editor import GiftQuestionRESTHandler
+from modules.dashboard.question_editor import McQuestionRESTHandler
 from modules.dashboard.question_group_editor import QuestionGroupRESTHandler
 from modules.dashboard.role_editor import RoleRESTHandler
 
@@ -246,6 +249,128 @@ class QuestionDashboardTestCase(actions.TestBase):
             asset_tables[1].find('./tbody/tr/td/a').tail, description
         )
 
+    def _put_question_group(self, **request):
+        QG_URL = '/%s%s' % (self.COURSE_NAME, QuestionGroupRESTHandler.URI)
+        xsrf_token = crypto.XsrfTokenManager.create_xsrf_token(
+            QuestionGroupRESTHandler.XSRF_TOKEN)
+        request['xsrf_token'] = cgi.escape(xsrf_token)
+        response = self.put(QG_URL, {'request': transforms.dumps(request)})
+        self.assertEquals(response.status_int, 200)
+        return transforms.loads(response.body)
+
+    def test_adding_question_groups_in_batch(self):
+        descriptions = ['Group A', 'Group B']
+        payloads = [{
+            'key': None,
+            'payload': transforms.dumps({
+                'description': description,
+                'version': QuestionGroupRESTHandler.SCHEMA_VERSIONS[0],
+                'introduction': '',
+                'items': []})} for description in descriptions]
+        payload = self._put_question_group(payloads=payloads)
+        self.assertEquals(payload['status'], 200)
+        self.assertEquals(payload['message'], 'Saved.')
+        keys = transforms.loads(payload['payload'])['keys']
+        self.assertEquals(2, len(keys))
+        self.assertEquals(
+            descriptions,
+            [models.QuestionGroupDAO.load(key).description for key in keys])
+
+    def test_adding_question_group_with_decoded_payload(self):
+        description = 'Question Group'
+        payload = self._put_question_group(payload={
+            'description': description,
+            'version': QuestionGroupRESTHandler.SCHEMA_VERSIONS[0],
+            'introduction': '',
+            'items': []})
+        self.assertEquals(payload['status'], 200)
+        key = transforms.loads(payload['payload'])['key']
+        self.assertEquals(
+            description, models.QuestionGroupDAO.load(key).description)
+
+    def test_batch_with_invalid_item_saves_nothing(self):
+        payloads = [{
+            'key': None,
+            'payload': transforms.dumps({
+                'description': 'Group A',
+                'version': version,
+                'introduction': '',
+                'items': []})} for version in (
+                    QuestionGroupRESTHandler.SCHEMA_VERSIONS[0], 'bogus')]
+        payload = self._put_question_group(payloads=payloads)
+        self.assertEquals(payload['status'], 412)
+        self.assertEquals(payload['message'], 'Version bogus not supported.')
+        self.assertEquals([], models.QuestionGroupDAO.get_all())
+
+    def test_batch_with_repeated_description_saves_nothing(self):
+        payloads = [{
+            'key': None,
+            'payload': {
+                'description': 'Group A',
+                'version': QuestionGroupRESTHandler.SCHEMA_VERSIONS[0],
+                'introduction': '',
+                'items': []}}] * 2
+        payload = self._put_question_group(payloads=payloads)
+        self.assertEquals(payload['status'], 412)
+        self.assertEquals(
+            payload['message'],
+            'The description must be different from existing question groups.')
+        self.assertEquals([], models.QuestionGroupDAO.get_all())
+
+    def test_batch_with_repeated_key_saves_nothing(self):
+        key = models.QuestionGroupDAO.save(models.QuestionGroupDTO(
+            None, {'description': 'Group A', 'items': []}))
+        payloads = [{
+            'key': key,
+            'payload': {
+                'description': description,
+                'version': QuestionGroupRESTHandler.SCHEMA_VERSIONS[0],
+                'introduction': '',
+                'items': []}} for description in ('Group B', 'Group C')]
+        payload = self._put_question_group(payloads=payloads)
+        self.assertEquals(payload['status'], 412)
+        self.assertEquals(
+            payload['message'], 'Item %s appears more than once.' % key)
+        self.assertEquals(
+            'Group A', models.QuestionGroupDAO.load(key).description)
+
+    def test_malformed_batch_is_rejected(self):
+        for payloads in (
+                'not a list', ['not a dict'], [{'key': None}],
+                [{'key': None, 'payload': 42}]):
+            payload = self._put_question_group(payloads=payloads)
+            self.assertEquals(payload['status'], 400)
+            self.assertEquals(payload['message'], 'Malformed request.')
+        self.assertEquals([], models.QuestionGroupDAO.get_all())
+
+    def test_non_admin_put_is_denied_before_parsing(self):
+        actions.login('student@foo.com', is_admin=False)
+        for handler in (QuestionGroupRESTHandler, GiftQuestionRESTHandler):
+            response = self.put(
+                '/%s%s' % (self.COURSE_NAME, handler.URI),
+                {'request': 'not JSON'})
+            payload = transforms.loads(response.body)
+            self.assertEquals(payload['status'], 401)
+            self.assertEquals(payload['message'], 'Access denied.')
+
+    def test_json_schema_dict_is_rebuilt_when_hooks_change(self):
+        json_schema_dict = McQuestionRESTHandler.get_json_schema_dict()
+        self.assertIs(
+            json_schema_dict, McQuestionRESTHandler.get_json_schema_dict())
+        self.assertNotIn('extra_field', json_schema_dict['properties'])
+
+        def add_extra_field(registry):
+            registry.add_property(schema_fields.SchemaField(
+                'extra_field', 'Extra', 'string', optional=True))
+
+        McQuestionRESTHandler.SCHEMA_LOAD_HOOKS.append(add_extra_field)
+        try:
+            self.assertIn(
+                'extra_field',
+                McQuestionRESTHandler.get_json_schema_dict()['properties'])
+        finally:
+            McQuestionRESTHandler.SCHEMA_LOAD_HOOKS.remove(add_extra_field)
+
     def test_last_modified_timestamp(self):
         begin_time = time.time()
         question_dto = models.QuestionDTO(None, {})
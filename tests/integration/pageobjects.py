@@ -32,44 +32,118 @@ from selenium.webdriver.support import wait
 
 
 DEFAULT_TIMEOUT = 15
+FAST_POLL_FREQUENCY = 0.25
+GET_RETRY_TIMEOUT = 50
+
+# Base URLs of integration servers known to have the default course deployed.
+_DEFAULT_COURSE_INITIALIZED = {}
+
+_INSTANCEID_RE = re.compile(r' instanceid="([^"]*)"')
+_PAREN_RE = re.compile(r'\(.*\)')
+
+# True once the first links reading 'Close' and 'Save' are both shown, in
+# the spirit of element_to_be_clickable on a partial link text locator.
+_BOTH_READY_JS = (
+    'function shown(text) {'
+    '  var links = document.getElementsByTagName("a");'
+    '  for (var i = 0; i < links.length; i++) {'
+    '    if (links[i].innerText.indexOf(text) >= 0) {'
+    '      var rect = links[i].getBoundingClientRect();'
+    '      return rect.width > 0 && rect.height > 0 &&'
+    '          window.getComputedStyle(links[i]).visibility == "visible";'
+    '    }'
+    '  }'
+    '  return false;'
+    '}'
+    'return shown("Close") && shown("Save");')
 
 
 def get_parent_element(web_element):
     return web_element.find_element_by_xpath('..')
 
 
+def _xpath_literal(text):
+    """Quote text for use as a string literal in an XPath expression."""
+    if '"' not in text:
+        return '"%s"' % text
+    if "'" not in text:
+        return "'%s'" % text
+    return 'concat(%s)' % ', \'"\', '.join(
+        '"%s"' % part for part in text.split('"'))
+
+
 class PageObject(object):
     """Superclass to hold shared logic used by page objects."""
 
     def __init__(self, tester):
         self._tester = tester
+        self._el_cache = {}
+
+    def _invalidate_cache(self):
+        self._el_cache.clear()
+
+    def _with_cached_element(self, by_kind, selector, action):
+        """Apply action to a memoized element, re-finding it if stale."""
+        key = (by_kind, selector)
+        element = self._el_cache.get(key)
+        if element is not None:
+            try:
+                return action(element)
+            except exceptions.StaleElementReferenceException:
+                del self._el_cache[key]
+        element = self._tester.driver.find_element(by_kind, selector)
+        self._el_cache[key] = element
+        return action(element)
+
+    def _status_message(self, action):
+        return self._with_cached_element(
+            by.By.ID, 'gcb-butterbar-message', action)
 
     def get(self, url, can_retry=True):
-        if can_retry:
-            tries = 10
-        else:
-            tries = 1
-        while tries > 0:
-            tries -= 1
-            self._tester.driver.get(url)
-            if 'The website may be down' in self._tester.driver.page_source:
-                time.sleep(5)
-                continue
-            return
-        raise exceptions.TimeoutException(
-            'Timeout waiting for %s page to load', url)
+        """Load url, reloading with backoff while the server is still down."""
+
+        self._invalidate_cache()
+
+        def loaded(driver):
+            driver.get(url)
+            return 'The website may be down' not in driver.page_source
 
-    def wait(self, timeout=None):
+        deadline = time.time() + (GET_RETRY_TIMEOUT if can_retry else 0)
+        poll_frequency = 0.5
+        while True:
+            try:
+                wait.WebDriverWait(
+                    self._tester.driver,
+                    min(deadline - time.time(), 4 * poll_frequency),
+                    poll_frequency=poll_frequency).until(loaded)
+                return
+            except exceptions.TimeoutException:
+                if time.time() >= deadline:
+                    raise exceptions.TimeoutException(
+                        'Timeout waiting for %s page to load' % url)
+                poll_frequency = min(2 * poll_frequency, 2)
+
+    def wait(self, timeout=None, poll_frequency=wait.POLL_FREQUENCY):
         if timeout is None:
             timeout = DEFAULT_TIMEOUT
-        return wait.WebDriverWait(self._tester.driver, timeout)
+        return wait.WebDriverWait(
+            self._tester.driver, timeout, poll_frequency=poll_frequency)
+
+    def fast_wait(self, timeout=None):
+        """Like wait(), polling more often; use only with cheap predicates."""
+        return self.wait(timeout=timeout, poll_frequency=FAST_POLL_FREQUENCY)
 
     def find_element_by_css_selector(self, selector, index=None):
         if index is None:
             return self._tester.driver.find_element_by_css_selector(selector)
-        else:
-            return self._tester.driver.find_elements_by_css_selector(
-                selector)[index]
+        # Pick the match in the browser rather than serializing every match.
+        element = self._tester.driver.execute_script(
+            'return document.querySelectorAll(arguments[0])[arguments[1]];',
+            selector, index)
+        if element is None:
+            raise exceptions.NoSuchElementException(
+                'No match %d for %s' % (index, selector))
+        return element
 
     def find_element_by_id(self, elt_id):
         return self._tester.driver.find_element_by_id(elt_id)
@@ -77,24 +151,48 @@ class PageObject(object):
     def find_element_by_link_text(self, text, index=None):
         if index is None:
             return self._tester.driver.find_element_by_link_text(text)
-        else:
-            return self._tester.driver.find_elements_by_link_text(text)[index]
+        # Like Selenium's link text locator, only count links that are
+        # shown, so hidden copies of a link do not shift the index.
+        element = self._tester.driver.execute_script(
+            'var text = arguments[0];'
+            'return Array.prototype.filter.call('
+            '    document.getElementsByTagName("a"), function(link) {'
+            '      return link.getClientRects().length > 0 &&'
+            '          window.getComputedStyle(link).visibility == "visible" &&'
+            '          link.innerText.trim() == text;'
+            '    })[arguments[1]] || null;', text, index)
+        if element is None:
+            raise exceptions.NoSuchElementException(
+                'No visible link %d with text %s' % (index, text))
+        return element
 
     def find_element_by_name(self, name):
         return self._tester.driver.find_element_by_name(name)
 
+    def _wait_for_name(self, name, timeout=5):
+        """Wait for a form field to be rendered and return it."""
+        return self.wait(timeout=timeout).until(
+            ec.presence_of_element_located((by.By.NAME, name)))
+
     def expect_status_message_to_be(self, value):
         self.wait().until(
-            ec.text_to_be_present_in_element(
-                (by.By.ID, 'gcb-butterbar-message'), value))
+            lambda unused_driver: self._status_message(
+                lambda message: value in message.text))
 
     def wait_until_status_message_hidden(self):
-        self.wait().until(
-            ec.invisibility_of_element_located(
-                (by.By.ID, 'gcb-butterbar-message')))
+
+        def status_message_hidden(unused_driver):
+            try:
+                return self._status_message(
+                    lambda message: not message.is_displayed())
+            except exceptions.NoSuchElementException:
+                return True
+
+        self.wait().until(status_message_hidden)
         return self
 
     def go_back(self):
+        self._invalidate_cache()
         self._tester.driver.back()
         return self
 
@@ -105,9 +203,8 @@ class PageObject(object):
 
     def where_am_i(self):
         """Returns the last part of the current url, after /."""
-        if '/' in self._tester.driver.current_url:
-            return self._tester.driver.current_url.split('/')[-1]
-        return None
+        _, separator, last = self._tester.driver.current_url.rpartition('/')
+        return last if separator else None
 
 
 class EditorPageObject(PageObject):
@@ -116,11 +213,21 @@ class EditorPageObject(PageObject):
     def __init__(self, tester):
         super(EditorPageObject, self).__init__(tester)
 
-        def successful_butter_bar(unused_driver):
-            butter_bar_message = self.find_element_by_id(
-                'gcb-butterbar-message')
-            return 'Success' in butter_bar_message.text or (
-                not butter_bar_message.is_displayed())
+        def successful_butter_bar(driver):
+            # One round trip per poll: succeed once the message is hidden
+            # (the butterbar fades out via opacity/visibility) or reports
+            # success; keep polling until the element exists.
+            return driver.execute_script(
+                'var e = document.getElementById("gcb-butterbar-message");'
+                'if (!e) { return false; }'
+                'for (var n = e; n.nodeType == 1; n = n.parentNode) {'
+                '  var style = window.getComputedStyle(n);'
+                '  if (style.display == "none" || style.opacity == "0") {'
+                '    return true;'
+                '  }'
+                '}'
+                'return window.getComputedStyle(e).visibility != "visible" ||'
+                '    e.textContent.indexOf("Success") >= 0;')
 
         self.wait().until(successful_butter_bar)
 
@@ -138,15 +245,32 @@ class EditorPageObject(PageObject):
         self.find_element_by_link_text('Close').click()
         return continue_page(self._tester)
 
+    # Returns the nth CodeMirror editor on the page. The instances are
+    # cached on window; the cache is rebuilt unless it still has one entry
+    # per live editor and its nth entry is the nth live editor, so adding
+    # or removing an editor anywhere before n is noticed.
+    _GET_CODEMIRROR_JS = (
+        'var n = arguments[0];'
+        'var live = $(".CodeMirror");'
+        'var cm = window.__cm;'
+        'if (!cm || cm.length != live.length || !cm[n] ||'
+        '    cm[n].getWrapperElement() !== live[n]) {'
+        '  cm = window.__cm = live.map(function() {'
+        '    return this.CodeMirror;'
+        '  }).get();'
+        '}'
+        'var editor = cm[n];')
+
     def setvalue_codemirror(self, nth_instance, code_body):
         self._tester.driver.execute_script(
-            "$('.CodeMirror')[%s].CodeMirror.setValue('%s');" % (
-                nth_instance, code_body))
+            self._GET_CODEMIRROR_JS + 'editor.setValue(arguments[1]);',
+            nth_instance, code_body)
         return self
 
     def assert_equal_codemirror(self, nth_instance, expected_code_body):
         actual_code_body = self._tester.driver.execute_script(
-            "return $('.CodeMirror')[%s].CodeMirror.getValue();" % nth_instance)
+            self._GET_CODEMIRROR_JS + 'return editor.getValue();',
+            nth_instance)
         self._tester.assertEqual(expected_code_body, actual_code_body)
         return self
 
@@ -164,9 +288,13 @@ class RootPage(PageObject):
     def _add_default_course_if_needed(self, base_url):
         """Setup default read-only course if not yet setup."""
 
+        if _DEFAULT_COURSE_INITIALIZED.get(base_url):
+            return
+
         # check default course is deployed
         self.get(base_url + '/')
         if 'Power Searching with Google' in self._tester.driver.page_source:
+            _DEFAULT_COURSE_INITIALIZED[base_url] = True
             return
 
         # deploy it
@@ -177,6 +305,7 @@ class RootPage(PageObject):
         ).set_status('Active').click_save()
         self.get(base_url + '/admin/global?action=courses')
         self.find_element_by_link_text('Logout').click()
+        _DEFAULT_COURSE_INITIALIZED[base_url] = True
 
     def load(self, base_url):
         self.get(base_url + '/')
@@ -248,18 +377,17 @@ class AnnouncementsPage(PageObject):
 
     def verify_announcement(self, title=None, date=None, body=None):
         """Verify that the announcement has the given fields."""
+        title_text, date_text, body_text = self._tester.driver.execute_script(
+            'var h = document.querySelectorAll("div.gcb-aside h2");'
+            'var p = document.querySelectorAll("div.gcb-aside p");'
+            'function text(e) { return e ? e.innerText.trim() : null; }'
+            'return [text(h[0]), text(p[0]), text(p[1])];')
         if title:
-            self._tester.assertEquals(
-                title, self._tester.driver.find_elements_by_css_selector(
-                    'div.gcb-aside h2')[0].text)
+            self._tester.assertEquals(title, title_text)
         if date:
-            self._tester.assertEquals(
-                date, self._tester.driver.find_elements_by_css_selector(
-                    'div.gcb-aside p')[0].text)
+            self._tester.assertEquals(date, date_text)
         if body:
-            self._tester.assertEquals(
-                body, self._tester.driver.find_elements_by_css_selector(
-                    'div.gcb-aside p')[1].text)
+            self._tester.assertEquals(body, body_text)
         return self
 
 
@@ -311,17 +439,19 @@ class DashboardPage(PageObject):
     def verify_read_only_course(self):
         self._tester.assertEquals(
             'Read-only course.',
-            self.find_element_by_id('gcb-butterbar-message').text)
+            self._status_message(lambda message: message.text))
         return self
 
     def verify_selected_group(self, group_name):
-        group = self.find_element_by_id('menu-group__edit')
-        self._tester.assertIn('gcb-active-group', group.get_attribute('class'))
+        self._tester.assertIn(
+            'gcb-active-group', self._tester.driver.execute_script(
+                'return document.getElementById("menu-group__edit")'
+                '.className;'))
 
     def verify_not_publicly_available(self):
         self._tester.assertEquals(
             'The course is not publicly available.',
-            self.find_element_by_id('gcb-butterbar-message').text)
+            self._status_message(lambda message: message.text))
         return self
 
     def find_menu_group(self, name):
@@ -336,9 +466,20 @@ class DashboardPage(PageObject):
                 '.gcb-collapse__content a')
             self.wait(1000).until(lambda s: content.is_displayed())
 
+    def _go_to_menu_item(self, group_name, link_text):
+        """Load a left-nav menu link without expanding its group first."""
+        link = self._tester.driver.find_element_by_xpath(
+            '//*[@id="menu-group__%s"]//a[normalize-space(.)=%s]' % (
+                group_name, _xpath_literal(link_text)))
+        href = link.get_attribute('href')
+        if href and not href.startswith('javascript:'):
+            self.get(href)
+        else:
+            self.ensure_menu_group_is_open(group_name)
+            link.click()
+
     def click_admin(self):
-        self.ensure_menu_group_is_open('admin')
-        self.find_element_by_link_text('Courses').click()
+        self._go_to_menu_item('admin', 'Courses')
         return AdminPage(self._tester)
 
     def click_import(self):
@@ -373,18 +514,15 @@ class DashboardPage(PageObject):
         return AddLesson(self._tester, expected_message='')
 
     def click_style(self):
-        self.ensure_menu_group_is_open('style')
-        self.find_element_by_link_text('CSS').click()
+        self._go_to_menu_item('style', 'CSS')
         return AssetsPage(self._tester)
 
     def click_edit(self):
-        self.ensure_menu_group_is_open('edit')
-        self.find_element_by_link_text('Outline').click()
+        self._go_to_menu_item('edit', 'Outline')
         return AssetsPage(self._tester)
 
     def click_settings(self):
-        self.ensure_menu_group_is_open('settings')
-        self.find_element_by_link_text('Course').click()
+        self._go_to_menu_item('settings', 'Course')
         return SettingsPage(self._tester)
 
     def verify_course_outline_contains_unit(self, unit_title):
@@ -396,8 +534,7 @@ class DashboardPage(PageObject):
         return LessonPage(self._tester)
 
     def click_analytics(self, name):
-        self.ensure_menu_group_is_open('analytics')
-        self.find_element_by_link_text(name).click()
+        self._go_to_menu_item('analytics', name)
         return AnalyticsPage(self._tester)
 
     def click_course(self):
@@ -406,8 +543,7 @@ class DashboardPage(PageObject):
         return RootPage(self._tester)
 
     def click_i18n(self):
-        self.ensure_menu_group_is_open('publish')
-        self.find_element_by_link_text('Translations').click()
+        self._go_to_menu_item('publish', 'Translations')
         return self
 
 
@@ -415,17 +551,21 @@ class CourseContentPage(RootPage):
     """Page object for viewing course content."""
 
     def _find_question(self, question_batch_id, question_text):
-        questions = self._tester.driver.find_elements_by_css_selector(
+        num_questions, question = self._tester.driver.execute_script(
+            'var questions = document.querySelectorAll(arguments[0]);'
+            'var questionText = arguments[1];'
+            'var matches = Array.prototype.filter.call(questions, function(q) {'
+            '  var text = q.querySelector(".qt-question");'
+            '  return text && text.innerText.trim() == questionText;'
+            '});'
+            'return [questions.length, matches[0] || null];',
             '[data-question-batch-id="%s"] .qt-mc-question.qt-standalone' %
-            question_batch_id)
-        if not questions:
+            question_batch_id, question_text)
+        if not num_questions:
             raise AssertionError('No questions in batch "%s" found' %
                                  question_batch_id)
-
-        for question in questions:
-            if (question.find_element_by_css_selector('.qt-question').text ==
-                question_text):
-                return question
+        if question is not None:
+            return question
         raise AssertionError('No questions in batch "%s" ' % question_batch_id +
                              'matched "%s"' % question_text)
 
@@ -493,7 +633,8 @@ class LessonPage(CourseContentPage):
     def play_video(self, instanceid):
         self._tester.driver.execute_script(
             'document.getElementById("%s").play();' % instanceid)
-        time.sleep(1)  # Let the video get started before we do anything else.
+        # Let the video get started before we do anything else.
+        self.wait_for_video_state(instanceid, 'paused', False, 5)
         return self
 
     def pause_video(self, instanceid):
@@ -552,7 +693,7 @@ class LessonPage(CourseContentPage):
     def edit_lesson_iframe_setvalue_codemirror(self, value, index=None):
         with self._edit_lesson_iframe():
             self._tester.driver.execute_script(
-                "$('.CodeMirror')[0].CodeMirror.setValue('%s');" % value)
+                '$(".CodeMirror")[0].CodeMirror.setValue(arguments[0]);', value)
         return self
 
     def edit_lesson_iframe_click_save(self, index=None):
@@ -597,10 +738,15 @@ class SettingsPage(PageObject):
     def __init__(self, tester):
         super(SettingsPage, self).__init__(tester)
 
-        def successful_load(unused_driver):
-            tab = self.find_element_by_link_text('Homepage')
-            print tab, tab.get_attribute('class'), tab.get_attribute('href')
-            return 'selected' == tab.get_attribute('class')
+        def successful_load(driver):
+            return driver.execute_script(
+                'var links = document.getElementsByTagName("a");'
+                'for (var i = 0; i < links.length; i++) {'
+                '  if (links[i].innerText.trim() == "Homepage") {'
+                '    return links[i].className == "selected";'
+                '  }'
+                '}'
+                'return false;')
 
         self.wait().until(successful_load)
 
@@ -612,9 +758,11 @@ class CourseOptionsEditorPage(EditorPageObject):
         return self._close_and_return_to(SettingsPage)
 
     def click_close_and_confirm(self):
-        self.find_element_by_link_text('Close').click()
+        close = self.find_element_by_link_text('Close')
+        close.click()
         self._tester.driver.switch_to_alert().accept()
-        time.sleep(0.2)
+        # Wait for the editor to unload so SettingsPage checks the new page.
+        self.wait().until(ec.staleness_of(close))
         return SettingsPage(self._tester)
 
     def set_course_name(self, name):
@@ -675,15 +823,15 @@ class AssetsPage(PageObject):
 
     def verify_question_exists(self, description):
         """Verifies question description exists on list of question banks."""
-        tds = self._tester.driver.find_elements_by_css_selector(
-            '#gcb-main-content tbody td')
-        for td in tds:
-            try:
-                self._tester.assertEquals(description, td.text)
-                return self
-            except AssertionError:
-                continue
-        raise AssertionError(description + ' not found')
+        found = self._tester.driver.execute_script(
+            'var description = arguments[0];'
+            'return Array.prototype.some.call('
+            '  document.querySelectorAll("#gcb-main-content tbody td"),'
+            '  function(td) { return td.innerText.trim() == description; });',
+            description)
+        if not found:
+            raise AssertionError(description + ' not found')
+        return self
 
     def click_question_preview(self):
         self.find_element_by_css_selector(
@@ -820,7 +968,7 @@ class ShortAnswerEditorPage(QuestionEditorPage):
 class LabelEditorPage(EditorPageObject):
 
     def set_title(self, text):
-        title_el = self.find_element_by_name('title')
+        title_el = self._wait_for_name('title')
         title_el.clear()
         title_el.send_keys(text)
         return self
@@ -836,10 +984,29 @@ class LabelEditorPage(EditorPageObject):
         description_el.send_keys(description)
         return self
 
-    def verify_description(self, description):
-        description_el = self.find_element_by_name('description')
-        self._tester.assertEqual(description,
-                                 description_el.get_attribute('value'))
+    def snapshot_form_state(self):
+        """Read the description and type radio states in one round trip.
+
+        Pass the result to verify_description and verify_type to check
+        several fields of the same form without going back to the browser.
+        """
+        return self._tester.driver.execute_script(
+            'var types = {};'
+            'Array.prototype.forEach.call('
+            '    document.querySelectorAll("[id^=_inputex_radioId]"),'
+            '    function(radio) { types[radio.id] = radio.checked; });'
+            'var description = document.querySelector("[name=description]");'
+            'return {'
+            '  description: description ? description.value : null,'
+            '  types: types'
+            '};')
+
+    def verify_description(self, description, state=None):
+        if state is None:
+            actual = self._wait_for_name('description').get_attribute('value')
+        else:
+            actual = state['description']
+        self._tester.assertEqual(description, actual)
         return self
 
     def set_type(self, type_num):
@@ -847,9 +1014,11 @@ class LabelEditorPage(EditorPageObject):
         type_el.click()
         return self
 
-    def verify_type(self, type_num):
-        type_el = self.find_element_by_id('_inputex_radioId%d' % type_num)
-        self._tester.assertEqual('true', type_el.get_attribute('checked'))
+    def verify_type(self, type_num, state=None):
+        if state is None:
+            state = self.snapshot_form_state()
+        self._tester.assertTrue(
+            state['types'].get('_inputex_radioId%d' % type_num))
         return self
 
     def click_delete(self):
@@ -892,13 +1061,60 @@ class AddLink(DashboardEditor):
 
 class CourseContentElement(DashboardEditor):
 
+    def __init__(self, tester):
+        super(CourseContentElement, self).__init__(tester)
+        # Whether the currently open RTE lightbox has finished loading.
+        self._rte_iframe_ready = False
+        # Whether the driver is still focused on the lightbox iframe.
+        self._in_rte_frame = False
+
+    def set_status(self, status):
+        self._require_default_content()
+        return super(CourseContentElement, self).set_status(status)
+
+    def click_save(self, link_text='Save', status_message='Saved'):
+        self._require_default_content()
+        return super(CourseContentElement, self).click_save(
+            link_text=link_text, status_message=status_message)
+
+    def _close_and_return_to(self, continue_page):
+        self._require_default_content()
+        return super(CourseContentElement, self)._close_and_return_to(
+            continue_page)
+
+    def setvalue_codemirror(self, nth_instance, code_body):
+        self._require_default_content()
+        return super(CourseContentElement, self).setvalue_codemirror(
+            nth_instance, code_body)
+
+    def assert_equal_codemirror(self, nth_instance, expected_code_body):
+        self._require_default_content()
+        return super(CourseContentElement, self).assert_equal_codemirror(
+            nth_instance, expected_code_body)
+
+    def expect_status_message_to_be(self, value):
+        self._require_default_content()
+        return super(CourseContentElement, self).expect_status_message_to_be(
+            value)
+
+    def wait_until_status_message_hidden(self):
+        self._require_default_content()
+        return super(
+            CourseContentElement, self).wait_until_status_message_hidden()
+
+    def go_back(self):
+        self._require_default_content()
+        return super(CourseContentElement, self).go_back()
+
     def set_title(self, title):
-        title_el = self.find_element_by_name('title')
+        self._require_default_content()
+        title_el = self._wait_for_name('title')
         title_el.clear()
         title_el.send_keys(title)
         return self
 
     def _click_tab(self, field_index=None, button_index=0, selected=True):
+        self._require_default_content()
         self.wait_until_status_message_hidden()
         buttonbar = self.find_element_by_css_selector(
             'div.cb-editor-field div.buttonbar-div', index=field_index)
@@ -920,6 +1136,7 @@ class CourseContentElement(DashboardEditor):
         return self
 
     def _assert_tab_selected(self, field_index=None, button_index=0):
+        self._require_default_content()
         self.wait_until_status_message_hidden()
         buttonbar = self.find_element_by_css_selector(
             'div.cb-editor-field div.buttonbar-div', index=field_index)
@@ -935,53 +1152,70 @@ class CourseContentElement(DashboardEditor):
         return self
 
     def click_rte_add_custom_tag(self, button_text, index=0):
+        self._require_default_content()
         self.find_element_by_link_text(button_text, index).click()
+        self._rte_iframe_ready = False
         return self
 
     def _ensure_rte_iframe_ready_and_switch_to_it(self):
-        self.wait().until(
-            ec.frame_to_be_available_and_switch_to_it('modal-editor-iframe'))
-        # Ensure inputEx has initialized too
-        close_clickable = ec.element_to_be_clickable(
-            (by.By.PARTIAL_LINK_TEXT, 'Close'))
-        save_clickable = ec.element_to_be_clickable(
-            (by.By.PARTIAL_LINK_TEXT, 'Save'))
-        def both_clickable(driver):
-            return close_clickable(driver) and save_clickable(driver)
-        self.wait().until(both_clickable)
+        if self._in_rte_frame:
+            return
+        if self._rte_iframe_ready:
+            self._tester.driver.switch_to_frame('modal-editor-iframe')
+        else:
+            self.fast_wait().until(ec.frame_to_be_available_and_switch_to_it(
+                'modal-editor-iframe'))
+            # Ensure inputEx has initialized too
+            self.fast_wait().until(
+                lambda driver: driver.execute_script(_BOTH_READY_JS))
+            self._rte_iframe_ready = True
+        self._in_rte_frame = True
+
+    def _leave_rte(self):
+        self._tester.driver.switch_to_default_content()
+        self._in_rte_frame = False
+
+    def _require_default_content(self):
+        """Leave the lightbox iframe if a previous RTE call stayed in it."""
+        if self._in_rte_frame:
+            self._leave_rte()
 
     def set_rte_lightbox_field(self, field_css_selector, value):
         self._ensure_rte_iframe_ready_and_switch_to_it()
         field = self.find_element_by_css_selector(field_css_selector)
         field.clear()
         field.send_keys(value)
-        self._tester.driver.switch_to_default_content()
+        # Stay in the lightbox; the next RTE call usually needs it too.
         return self
 
     def click_rte_save(self):
         self._ensure_rte_iframe_ready_and_switch_to_it()
         self.find_element_by_link_text('Save').click()
-        self._tester.driver.switch_to_default_content()
+        self._leave_rte()
+        self._rte_iframe_ready = False
         def is_hidden(driver):
             return 'hidden' in driver.find_element_by_id(
                 'modal-editor').get_attribute('class')
-        self.wait().until(is_hidden)
+        self.fast_wait().until(is_hidden)
         return self
 
     def send_rte_text(self, text):
+        self._require_default_content()
         iframe = self.find_element_by_css_selector('.yui-editor-editable')
         iframe.send_keys(keys.Keys.HOME)
         iframe.send_keys(text)
         return self
 
     def doubleclick_rte_element(self, elt_css_selector, index=0):
+        self._require_default_content()
         iframe = self.find_element_by_css_selector(
             '.yui-editor-editable', index=index)
-        self._tester.driver.switch_to_frame(iframe)
-        target = self.find_element_by_css_selector(elt_css_selector)
-        action_chains.ActionChains(
-            self._tester.driver).double_click(target).perform()
-        self._tester.driver.switch_to_default_content()
+        driver = self._tester.driver
+        driver.switch_to_frame(iframe)
+        target = driver.find_element_by_css_selector(elt_css_selector)
+        action_chains.ActionChains(driver).double_click(target).perform()
+        driver.switch_to_default_content()
+        self._rte_iframe_ready = False
         return self
 
     def ensure_rte_lightbox_field_has_value(self, field_css_selector, value):
@@ -990,16 +1224,17 @@ class CourseContentElement(DashboardEditor):
             value,
             self.find_element_by_css_selector(
                 field_css_selector).get_attribute('value'))
-        self._tester.driver.switch_to_default_content()
         return self
 
     def ensure_preview_document_matches_regex(self, regex, index=None):
+        self._require_default_content()
+
         def preview_spinner_closed(driver):
             spinner = self.find_element_by_css_selector(
                 'div.preview-editor div.ajax-spinner', index)
             return not spinner.is_displayed()
 
-        self.wait().until(preview_spinner_closed)
+        self.fast_wait().until(preview_spinner_closed)
 
         iframe = self.find_element_by_css_selector(
             'div.preview-editor iframe', index)
@@ -1010,18 +1245,14 @@ class CourseContentElement(DashboardEditor):
         return self
 
     def _get_rte_contents(self):
-        return self.find_element_by_css_selector(
-            'div.cb-editor-field div.rte-div textarea').get_attribute('value')
+        self._require_default_content()
+        return self._with_cached_element(
+            by.By.CSS_SELECTOR, 'div.cb-editor-field div.rte-div textarea',
+            lambda textarea: textarea.get_attribute('value'))
 
     def _get_instanceid_list(self):
         """Returns a list of the instanceid attrs in the lesson body."""
-        html = self._get_rte_contents()
-        html_list = html.split(' instanceid="')
-        instanceid_list = []
-        for item in html_list[1:]:
-            closing_quote_ind = item.find('"')
-            instanceid_list.append(item[:closing_quote_ind])
-        return instanceid_list
+        return _INSTANCEID_RE.findall(self._get_rte_contents())
 
     def ensure_instanceid_count_equals(self, value):
         self._tester.assertEqual(value, len(self._get_instanceid_list()))
@@ -1053,27 +1284,23 @@ class AddUnit(CourseContentElement):
         self.expect_status_message_to_be(expected_message)
 
     def set_pre_assessment(self, assessment_name):
-        select.Select(self.find_element_by_name(
+        self._require_default_content()
+        select.Select(self._wait_for_name(
             'pre_assessment')).select_by_visible_text(assessment_name)
         return self
 
     def set_post_assessment(self, assessment_name):
-        select.Select(self.find_element_by_name(
+        self._require_default_content()
+        select.Select(self._wait_for_name(
             'post_assessment')).select_by_visible_text(assessment_name)
         return self
 
     def set_contents_on_one_page(self, setting):
-        print
-        labels = self._tester.driver.find_elements_by_tag_name('label')
-        one_page_label = None
-        for label in labels:
-            if label.text == 'Show Contents on One Page':
-                one_page_label = label
-                break
-        label_div = one_page_label.find_element_by_xpath('..')
-        checkbox_div = label_div.find_element_by_xpath('..')
-        checkbox = checkbox_div.find_element_by_css_selector(
-            'input[type="checkbox"]')
+        self._require_default_content()
+        # The checkbox sits under the label's grandparent.
+        checkbox = self._tester.driver.find_element_by_xpath(
+            '//label[normalize-space(.)="Show Contents on One Page"]'
+            '/../..//input[@type="checkbox"]')
         if checkbox.is_selected() != setting:
             checkbox.click()
         return self
@@ -1107,16 +1334,19 @@ class AddLesson(CourseContentElement):
         return self
 
     def set_questions_are_scored(self):
+        self._require_default_content()
         select.Select(self.find_element_by_name(
             'scored')).select_by_visible_text('Questions are scored')
         return self
 
     def set_questions_give_feedback(self):
+        self._require_default_content()
         select.Select(self.find_element_by_name(
             'scored')).select_by_visible_text('Questions only give feedback')
         return self
 
     def select_content(self):
+        self._require_default_content()
         button = self.find_element_by_css_selector('.togglebutton.md-settings')
         self._tester.assertTrue(button.find_element_by_css_selector(
             'input[type="checkbox"]').is_selected())
@@ -1124,6 +1354,7 @@ class AddLesson(CourseContentElement):
         return self
 
     def select_settings(self):
+        self._require_default_content()
         button = self.find_element_by_css_selector('.togglebutton.md-settings')
         self._tester.assertFalse(button.find_element_by_css_selector(
             'input[type="checkbox"]').is_selected())
@@ -1139,8 +1370,7 @@ class AdminPage(DashboardPage):
         return AddCourseEditorPage(self._tester)
 
     def click_settings(self):
-        self.ensure_menu_group_is_open('admin')
-        self.find_element_by_link_text('Site settings').click()
+        self._go_to_menu_item('admin', 'Site settings')
         return AdminSettingsPage(self._tester)
 
 
@@ -1148,8 +1378,7 @@ class AdminSettingsPage(PageObject):
     """Page object for the admin settings."""
 
     def click_override_admin_user_emails(self):
-        self._tester.driver.find_elements_by_css_selector(
-            'button.gcb-button')[0].click()
+        self.find_element_by_css_selector('button.gcb-button').click()
         return ConfigPropertyOverridePage(self._tester)
 
     def click_override(self, setting_name):
@@ -1157,10 +1386,10 @@ class AdminSettingsPage(PageObject):
         return ConfigPropertyOverridePage(self._tester)
 
     def verify_admin_user_emails_contains(self, email):
-        self._tester.assertTrue(
-            email in self._tester.driver.find_elements_by_css_selector(
-                'table.gcb-config tr')[1].find_elements_by_css_selector(
-                    'td')[1].text)
+        # Second cell of the second row, counted across the whole table.
+        self._tester.assertIn(email, self._tester.driver.execute_script(
+            'var row = document.querySelectorAll("table.gcb-config tr")[1];'
+            'return row.querySelectorAll("td")[1].innerText;'))
 
 
 class ConfigPropertyOverridePage(EditorPageObject):
@@ -1192,7 +1421,7 @@ class AddCourseEditorPage(EditorPageObject):
 
     def set_fields(self, name=None, title=None, email=None):
         """Populate the fields in the add course page."""
-        name_el = self.find_element_by_name('name')
+        name_el = self._wait_for_name('name')
         title_el = self.find_element_by_name('title')
         email_el = self.find_element_by_name('admin_email')
 
@@ -1220,24 +1449,35 @@ class AnalyticsPage(PageObject):
         def data_source_logs_not_empty(unused_driver):
             return self.get_data_source_logs(data_source)
 
-        self.wait().until(data_source_logs_not_empty)
+        self.wait(poll_frequency=wait.POLL_FREQUENCY).until(
+            data_source_logs_not_empty)
         return self
 
     def get_data_page_number(self, data_source):
         # When there is a chart on the page, the chart-drawing animation
         # takes ~1 sec to complete, which blocks the JS to unpack and paint
-        # the data page numbers.
-        max_wait = time.time() + 10
-        text = self.find_element_by_id('model_visualizations_dump').text
-        while not text and time.time() < max_wait:
-            time.sleep(0.1)
-            text = self.find_element_by_id('model_visualizations_dump').text
-
-        numbers = {}
-        for line in text.split('\n'):
-            name, value = line.split('=')
-            numbers[name] = int(value)
-        return numbers[data_source]
+        # the data page numbers.  The dump is parsed in the browser; the
+        # result is wrapped in a list so that page number 0 ends the wait.
+        def parsed_page_number(driver):
+            return driver.execute_script(
+                'var dump = document.getElementById('
+                '    "model_visualizations_dump");'
+                'var text = dump ? dump.innerText : "";'
+                'if (!text) { return null; }'
+                'var numbers = {};'
+                'text.split("\\n").forEach(function(line) {'
+                '  var parts = line.split("=");'
+                '  numbers[parts[0]] = parseInt(parts[1], 10);'
+                '});'
+                'var source = arguments[0];'
+                'return [source in numbers ? numbers[source] : null];',
+                data_source)
+
+        number, = self.wait(timeout=10, poll_frequency=0.2).until(
+            parsed_page_number)
+        if number is None:
+            raise KeyError(data_source)
+        return number
 
     def get_displayed_page_number(self, data_source):
         return self.find_element_by_id('gcb_rest_source_page_number_' +
@@ -1255,12 +1495,8 @@ class AnalyticsPage(PageObject):
         self.find_element_by_id(name).click()
 
     def buttons_present(self, data_source):
-        try:
-            self.find_element_by_id('gcb_rest_source_request_zero_' +
-                                    data_source)
-            return True
-        except exceptions.NoSuchElementException:
-            return False
+        return bool(self._tester.driver.find_elements_by_id(
+            'gcb_rest_source_request_zero_' + data_source))
 
     def set_chunk_size(self, data_source, chunk_size):
         field = self.find_element_by_id(
@@ -1292,45 +1528,45 @@ class AppengineAdminPage(PageObject):
 class DatastorePage(PageObject):
 
     def get_items(self):
-        data_table = self._tester.driver.find_element_by_css_selector(
-            'table.ae-table')
-
-        title_elements = data_table.find_elements_by_css_selector(
-            'table.ae-table th')
-        for index, element in enumerate(title_elements):
-            if element.text.strip() == 'Key':
-                key_index = index
-
-        rows = data_table.find_elements_by_css_selector('tr')
-        data_urls = []
-        for row in rows:
-            cells = row.find_elements_by_css_selector('td')
-            if len(cells) > key_index:
-                url = cells[key_index].find_elements_by_tag_name(
-                    'a')[0].get_attribute('href')
-                data_urls.append(url)
+        self._tester.driver.find_element_by_css_selector('table.ae-table')
+        # Collect the entity links from the 'Key' column in one round trip.
+        data_urls = self._tester.driver.execute_script(
+            'var table = document.querySelector("table.ae-table");'
+            'var keyIndex = -1;'
+            'Array.prototype.forEach.call(table.querySelectorAll("th"),'
+            '    function(th, index) {'
+            '      if (th.innerText.trim() == "Key") { keyIndex = index; }'
+            '    });'
+            'var urls = [];'
+            'Array.prototype.forEach.call(table.querySelectorAll("tr"),'
+            '    function(row) {'
+            '      var cells = row.querySelectorAll("td");'
+            '      if (keyIndex >= 0 && cells.length > keyIndex) {'
+            '        urls.push(cells[keyIndex].querySelector("a").href);'
+            '      }'
+            '    });'
+            'return urls;')
 
         data = []
         for data_url in data_urls:
             self.get(data_url)
-            rows = self._tester.driver.find_elements_by_css_selector(
-                'div.ae-settings-block')
-            item = {}
-            data.append(item)
-            for row in rows:
-                labels = row.find_elements_by_tag_name('label')
-                if labels:
-                    name = re.sub(r'\(.*\)', '', labels[0].text).strip()
-                    value_blocks = row.find_elements_by_tag_name('div')
-                    if value_blocks:
-                        inputs = value_blocks[0].find_elements_by_tag_name(
-                            'input')
-                        if inputs:
-                            value = inputs[0].get_attribute('value').strip()
-                        else:
-                            value = value_blocks[0].text.strip()
-                        item[name] = value
-            self._tester.driver.back()
+            # Read every (label, value) pair on the detail page at once.
+            fields = self._tester.driver.execute_script(
+                'var fields = [];'
+                'Array.prototype.forEach.call('
+                '    document.querySelectorAll("div.ae-settings-block"),'
+                '    function(row) {'
+                '      var label = row.querySelector("label");'
+                '      var block = row.querySelector("div");'
+                '      if (!label || !block) { return; }'
+                '      var input = block.querySelector("input");'
+                '      fields.push([label.innerText,'
+                '                   input ? input.value : block.innerText]);'
+                '    });'
+                'return fields;')
+            data.append(dict(
+                (_PAREN_RE.sub('', label).strip(), value.strip())
+                for label, value in fields))
 
         return data
 
@@ -1363,7 +1599,12 @@ class EmbedModuleDemoPage(PageObject):
             'cb-embed > iframe')
 
     def get_cb_embed_srcs(self):
-        return [e.get_attribute('src') for e in self.get_cb_embed_elements()]
+        # Like WebElement.get_attribute, prefer the src property if defined.
+        return self._tester.driver.execute_script(
+            'return Array.prototype.map.call('
+            '    document.getElementsByTagName("cb-embed"), function(e) {'
+            '      return e.src !== undefined ? e.src : e.getAttribute("src");'
+            '    });')
 
     def get_cb_embed_text(self, index):
         """Gets text from a <cb-embed> that isn't an iframe."""
@@ -1371,12 +1612,16 @@ class EmbedModuleDemoPage(PageObject):
         return embed.text
 
     def get_iframe(self, url):
-        iframes = self._tester.driver.find_elements_by_tag_name('iframe')
-        for iframe in iframes:
-            if iframe.get_attribute('src') == url:
-                return iframe
-
-        return None
+        # Try an exact match on the src attribute first; fall back to the
+        # resolved src property so relative src attributes still match.
+        return self._tester.driver.execute_script(
+            'var url = arguments[0];'
+            'return document.querySelector('
+            '    "iframe[src=\\"" + CSS.escape(url) + "\\"]") ||'
+            '  Array.prototype.filter.call('
+            '    document.getElementsByTagName("iframe"), function(iframe) {'
+            '      return iframe.src == url;'
+            '    })[0] || null;', url)
 
 
 class EmbedModuleExampleEmbedPage(PageObject):
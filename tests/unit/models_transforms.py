@@ -184,6 +184,38 @@ class JsonToDictTests(unittest.TestCase):
             self.assertIsNone(ret['field'])
 
 
+class CompiledJsonToDictTests(JsonToDictTests):
+    """Runs the json_to_dict() tests against compile_json_to_dict()."""
+
+    def setUp(self):
+        super(CompiledJsonToDictTests, self).setUp()
+        self._json_to_dict = transforms.json_to_dict
+
+        def compiled_json_to_dict(
+                source_dict, schema, permit_none_values=False):
+            return transforms.compile_json_to_dict(
+                schema, permit_none_values=permit_none_values)(source_dict)
+        transforms.json_to_dict = compiled_json_to_dict
+
+    def tearDown(self):
+        transforms.json_to_dict = self._json_to_dict
+        super(CompiledJsonToDictTests, self).tearDown()
+
+    def test_nested_structures(self):
+        schema = wrap_properties({
+            'obj': {'type': 'object', 'properties': {
+                'num': {'type': 'integer'}}},
+            'arr': {'type': 'array', 'items': {'properties': {
+                'flag': {'type': 'boolean'}}}}})
+        convert = transforms.compile_json_to_dict(schema)
+        source = {'obj': {'num': '3'}, 'arr': [{'flag': 'true'}, {}]}
+        self.assertRaises(ValueError, convert, source)
+        source['arr'][1]['flag'] = False
+        self.assertEqual(
+            {'obj': {'num': 3}, 'arr': [{'flag': True}, {'flag': False}]},
+            convert(source))
+
+
 class StringValueConversionTests(unittest.TestCase):
 
     def test_value_to_string(self):